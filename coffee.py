@@ -4,11 +4,17 @@ Coffee Roulette - Weekly Team Pairing Tool
 """
 
 import click
+import heapq
 import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 DATA_FILE = Path('coffee.json')
 
@@ -36,17 +42,32 @@ def load_data():
         }
     
     try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
+        raw = DATA_FILE.read_bytes()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except (json.JSONDecodeError, FileNotFoundError):
         click.echo("Error: Could not read coffee.json file")
         return None
 
+def flatten_pairings(data):
+    """Merge each week's manual/auto pairs into a single 'pairs' list"""
+    for week_data in data.get("pairings", {}).values():
+        pairs = week_data.get("pairs", [])
+        for key in ("manual_pairs", "auto_pairs"):
+            pairs.extend(week_data.pop(key, []))
+        week_data["pairs"] = pairs
+    
+    # Drop the derived index older versions stored alongside the pairings
+    data.pop("pair_index", None)
+
 def save_data(data):
     """Save data to JSON file"""
+    flatten_pairings(data)
     try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        DATA_FILE.write_bytes(raw)
         return True
     except Exception as e:
         click.echo(f"Error saving data: {e}")
@@ -118,22 +139,23 @@ def list_people():
     inactive_people = []
     
     for name, info in data["people"].items():
-        status_info = f"{name} (left out: {info['times_left_out']}, participated: {info['total_weeks_participated']})"
+        left_out = info['times_left_out']
+        participated = info['total_weeks_participated']
         if info["active"]:
-            active_people.append(status_info)
+            active_people.append(f"  ✓ {name} (left out: {left_out}, participated: {participated})")
         else:
-            inactive_people.append(status_info)
+            inactive_people.append(f"  ✗ {name} (left out: {left_out}, participated: {participated})")
     
-    click.echo(f"\nActive people ({len(active_people)}):")
-    for person in active_people:
-        click.echo(f"  ✓ {person}")
+    # Build the whole listing and write it out in one go
+    lines = [f"\nActive people ({len(active_people)}):"]
+    lines.extend(active_people)
     
     if inactive_people:
-        click.echo(f"\nInactive people ({len(inactive_people)}):")
-        for person in inactive_people:
-            click.echo(f"  ✗ {person}")
+        lines.append(f"\nInactive people ({len(inactive_people)}):")
+        lines.extend(inactive_people)
     
-    click.echo("")
+    lines.append("")
+    click.echo("\n".join(lines))
 
 @cli.command()
 @click.option('--week', help='Week to generate pairings for (defaults to next week)')
@@ -204,9 +226,8 @@ def history(weeks):
         click.echo("No pairing history found.")
         return
     
-    # Sort weeks and show most recent
-    sorted_weeks = sorted(data["pairings"].keys(), reverse=True)
-    recent_weeks = sorted_weeks[:weeks]
+    # Show most recent weeks - week strings sort chronologically
+    recent_weeks = heapq.nlargest(weeks, data["pairings"].keys())
     
     click.echo(f"\nPairing history (last {len(recent_weeks)} weeks):")
     click.echo("-" * 40)
@@ -3,99 +3,98 @@
 Coffee Roulette Pairing Algorithm
 """
 
+import heapq
 import itertools
-from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 
-def get_all_possible_pairings(people):
-    """
-    Generate all possible ways to pair up a list of people.
-    Returns list of complete pairing solutions.
-    """
-    if len(people) < 2:
-        return []
-    
-    if len(people) == 2:
-        return [[[(people[0], people[1])], []]]  # [pairs, left_out]
-    
-    if len(people) == 3:
-        # With 3 people, we have 3 possible solutions (each person left out once)
-        return [
-            [[(people[1], people[2])], [people[0]]],
-            [[(people[0], people[2])], [people[1]]],
-            [[(people[0], people[1])], [people[2]]]
-        ]
-    
-    solutions = []
-    
-    # Try each person as potentially left out (if odd number)
-    if len(people) % 2 == 1:
-        for i, left_out_person in enumerate(people):
-            remaining_people = people[:i] + people[i+1:]
-            pairings = generate_pairings_for_even_group(remaining_people)
-            for pairing in pairings:
-                solutions.append([pairing, [left_out_person]])
-    else:
-        # Even number - everyone gets paired
-        pairings = generate_pairings_for_even_group(people)
-        for pairing in pairings:
-            solutions.append([pairing, []])
-    
-    return solutions
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+DEFAULT_WEIGHTS = {
+    'first_time_meeting': 10,
+    'recent_pairing_penalty': -5,  # Last 2 weeks
+    'old_pairing_penalty': -1,     # 3-4 weeks ago
+    'fairness_bonus': 3,           # Per times_left_out difference from average
+}
 
-def generate_pairings_for_even_group(people):
+@lru_cache(maxsize=None)
+def _pairings_of(mask):
     """
-    Generate all possible pairings for an even number of people.
-    Returns list of pairing arrangements.
+    All pairings of a set of people, as a tuple of tuples of index pairs.
+    
+    The set is a bitmask where bit i means person i is still unpaired, so
+    removing people is integer arithmetic rather than list slicing.
+    Different branches of the recursion keep reaching the same set of
+    remaining people, so results are cached per mask. Call
+    _pairings_of.cache_clear() once done to free the memory.
     """
-    if len(people) == 0:
-        return [[]]
-    if len(people) == 2:
-        return [[(people[0], people[1])]]
+    if not mask:
+        return ((),)
     
-    # Take first person and pair with each other person
-    first_person = people[0]
-    remaining = people[1:]
+    # Always pair the lowest remaining person first
+    first_bit = mask & -mask
+    first_person = first_bit.bit_length() - 1
+    remaining = mask ^ first_bit
     
     all_pairings = []
     
-    for i, partner in enumerate(remaining):
-        # Create this pair
-        current_pair = (first_person, partner)
-        
-        # Get remaining people (excluding the partner)
-        rest = remaining[:i] + remaining[i+1:]
+    partners = remaining
+    while partners:
+        partner_bit = partners & -partners
+        partners ^= partner_bit
+        current_pair = (first_person, partner_bit.bit_length() - 1)
         
-        # Get all possible pairings for the rest
-        sub_pairings = generate_pairings_for_even_group(rest)
-        
-        # Add current pair to each sub-pairing
-        for sub_pairing in sub_pairings:
-            complete_pairing = [current_pair] + sub_pairing
-            all_pairings.append(complete_pairing)
+        # Add current pair to each pairing of the rest
+        for sub_pairing in _pairings_of(remaining ^ partner_bit):
+            all_pairings.append((current_pair,) + sub_pairing)
     
-    return all_pairings
+    return tuple(all_pairings)
+
+def _precompute_matchings(max_size):
+    """
+    Every pairing of every group size up to max_size, by index.
+    Returns dict: {size: ((index_pairs, left_out_index_or_None), ...)}
+    """
+    matchings = {}
+    for size in range(2, max_size + 1):
+        all_people = (1 << size) - 1
+        if size % 2 == 0:
+            matchings[size] = tuple((pairing, None) for pairing in _pairings_of(all_people))
+        else:
+            matchings[size] = tuple(
+                (pairing, left_out)
+                for left_out in range(size)
+                for pairing in _pairings_of(all_people ^ (1 << left_out))
+            )
+    _pairings_of.cache_clear()
+    return matchings
 
-def score_solution(pairs, left_out, data, target_week, weights=None):
+# Groups this small are nearly always what we see, and have few enough
+# pairings (10,395 for 11 people) to keep them all ready to score
+SMALL_GROUP_SIZE = 11
+_MATCHINGS = _precompute_matchings(SMALL_GROUP_SIZE)
+
+def score_solution(pairs, left_out, last_paired, avg_left_out, people_stats, target_week_num, weights=None):
     """
     Score a pairing solution based on various factors.
     
     Args:
         pairs: List of (person1, person2) tuples
         left_out: List of people left out this week
-        data: Full coffee roulette data structure
-        target_week: Week number we're generating for
+        last_paired: Dict of {(person1, person2): week_num} from get_last_paired_weeks()
+        avg_left_out: Average times_left_out across everyone
+        people_stats: The 'people' section of the coffee roulette data
+        target_week_num: Number of the week we're generating for
         weights: Dict of scoring weights (optional)
     
     Returns:
         (score, breakdown) tuple
     """
     if weights is None:
-        weights = {
-            'first_time_meeting': 10,
-            'recent_pairing_penalty': -5,  # Last 2 weeks
-            'old_pairing_penalty': -1,     # 3-4 weeks ago
-            'fairness_bonus': 3,           # Per times_left_out difference from average
-        }
+        weights = DEFAULT_WEIGHTS
     
     score = 0
     breakdown = {
@@ -106,71 +105,122 @@ def score_solution(pairs, left_out, data, target_week, weights=None):
         'total_pairs': len(pairs)
     }
     
-    # Get historical pairings for lookups
-    historical_pairs = get_historical_pairs(data)
-    
     # Score each pair
     for person1, person2 in pairs:
-        pair_key = tuple(sorted([person1, person2]))
-        
-        if pair_key not in historical_pairs:
-            # First time meeting!
-            score += weights['first_time_meeting']
-            breakdown['first_time_meetings'] += 1
-        else:
-            # Check how recent the last pairing was
-            last_weeks = historical_pairs[pair_key]
-            most_recent = max(last_weeks)
-            
-            # Convert week string to comparable number (simplified)
-            current_week_num = int(target_week.split('-')[1])
-            recent_week_num = int(most_recent.split('-')[1])
-            weeks_ago = current_week_num - recent_week_num
-            
-            if weeks_ago <= 2:
-                score += weights['recent_pairing_penalty']
-                breakdown['recent_pairings'] += 1
-            elif weeks_ago <= 4:
-                score += weights['old_pairing_penalty'] 
-                breakdown['old_pairings'] += 1
+        pair_score, category = score_pair(person1, person2, last_paired, target_week_num, weights)
+        score += pair_score
+        if category:
+            breakdown[category] += 1
     
     # Fairness scoring for who gets left out
     if left_out:
-        people_stats = data['people']
-        avg_left_out = sum(p.get('times_left_out', 0) for p in people_stats.values()) / len(people_stats)
-        
         for person in left_out:
-            person_left_out_count = people_stats.get(person, {}).get('times_left_out', 0)
-            fairness_diff = avg_left_out - person_left_out_count
-            fairness_score = fairness_diff * weights['fairness_bonus']
+            fairness_score = score_left_out(person, people_stats, avg_left_out, weights)
             score += fairness_score
             breakdown['fairness_score'] += fairness_score
     
     return score, breakdown
 
-def get_historical_pairs(data):
+def _pkey(a, b):
+    """Order-independent key for a pair, without sorting a list"""
+    return (a, b) if a < b else (b, a)
+
+def score_pair(person1, person2, last_paired, target_week_num, weights):
+    """
+    Score a single pair based on when (if ever) they last met.
+    
+    Returns:
+        (score, category) tuple, where category is the breakdown key the
+        pair counts towards, or None if it doesn't count towards any
+    """
+    pair_key = _pkey(person1, person2)
+    return score_last_met(last_paired.get(pair_key), target_week_num, weights)
+
+def score_last_met(last_week_num, target_week_num, weights):
     """
-    Extract all historical pairings from data.
-    Returns dict: {(person1, person2): [week1, week2, ...]}
+    Score a pair given the week number they last met, or None if never.
+    Returns (score, category) as for score_pair().
     """
-    pairs = defaultdict(list)
+    if last_week_num is None:
+        # First time meeting!
+        return weights['first_time_meeting'], 'first_time_meetings'
     
-    for week, week_data in data.get('pairings', {}).items():
-        # Handle both old and new format
-        all_pairs = []
-        if 'pairs' in week_data:
-            all_pairs.extend(week_data['pairs'])
-        if 'manual_pairs' in week_data:
-            all_pairs.extend(week_data['manual_pairs'])
-        if 'auto_pairs' in week_data:
-            all_pairs.extend(week_data['auto_pairs'])
-        
-        for pair in all_pairs:
+    # Check how recent the last pairing was
+    weeks_ago = target_week_num - last_week_num
+    
+    if weeks_ago <= 2:
+        return weights['recent_pairing_penalty'], 'recent_pairings'
+    elif weeks_ago <= 4:
+        return weights['old_pairing_penalty'], 'old_pairings'
+    
+    return 0, None
+
+def score_left_out(person, people_stats, avg_left_out, weights):
+    """Fairness score for leaving a person out, higher if they rarely sit out"""
+    person_left_out_count = people_stats.get(person, {}).get('times_left_out', 0)
+    fairness_diff = avg_left_out - person_left_out_count
+    return fairness_diff * weights['fairness_bonus']
+
+def _week_pairs(week_data):
+    """Yield every pair from a week's data"""
+    # Handle both old and new format
+    for key in ('pairs', 'manual_pairs', 'auto_pairs'):
+        for pair in week_data.get(key, ()):
             if len(pair) == 2:
-                pair_key = tuple(sorted(pair))
-                pairs[pair_key].append(week)
+                yield pair
+
+def get_last_paired_weeks(data):
+    """
+    Find the most recent week each historical pair met.
+    Returns dict: {(person1, person2): week_num}
+    """
+    last_paired = {}
     
-    return pairs
+    # Keep just the latest week per pair rather than building week lists
+    for week, week_data in data.get('pairings', {}).items():
+        week_num = _week_to_num(week)
+        for pair in _week_pairs(week_data):
+            pair_key = _pkey(*pair)
+            if last_paired.get(pair_key, -1) < week_num:
+                last_paired[pair_key] = week_num
+    
+    return last_paired
+
+@lru_cache(maxsize=None)
+def _week_to_num(week):
+    """
+    Convert a 'YYYY-WW' week string (as from strftime('%Y-%U')) to a
+    number that counts weeks continuously across year boundaries.
+    """
+    # Weeks start on Sunday, so count whole weeks up to that Sunday. This
+    # also makes week 00 the same week as the previous year's last week.
+    sunday = datetime.strptime(f"{week}-0", '%Y-%U-%w')
+    return sunday.toordinal() // 7
+
+def get_pair_weights(people, last_paired, target_week_num, weights):
+    """
+    Score every possible pair of people.
+    Returns dict: {(i, j): score} for each pair of indices i < j into people
+    """
+    # Re-key history by index, dropping pairs involving anyone not here
+    index = {person: i for i, person in enumerate(people)}
+    last_met = {}
+    for (person1, person2), week_num in last_paired.items():
+        i = index.get(person1)
+        j = index.get(person2)
+        if i is not None and j is not None:
+            last_met[_pkey(i, j)] = week_num
+    
+    return {
+        (i, j): score_last_met(last_met.get((i, j)), target_week_num, weights)[0]
+        for i, j in itertools.combinations(range(len(people)), 2)
+    }
+
+def get_average_left_out(people_stats):
+    """Average number of times each person has been left out"""
+    if not people_stats:
+        return 0
+    return sum(p.get('times_left_out', 0) for p in people_stats.values()) / len(people_stats)
 
 def find_best_pairings(active_people, data, target_week, manual_pairs=None, top_n=3):
     """
@@ -190,10 +240,7 @@ def find_best_pairings(active_people, data, target_week, manual_pairs=None, top_
         manual_pairs = []
     
     # Remove manually paired people from active list
-    manually_paired_people = set()
-    for pair in manual_pairs:
-        manually_paired_people.update(pair)
-    
+    manually_paired_people = frozenset(person for pair in manual_pairs for person in pair)
     available_people = [p for p in active_people if p not in manually_paired_people]
     
     print(f"Active people: {len(active_people)}")
@@ -208,22 +255,287 @@ def find_best_pairings(active_people, data, target_week, manual_pairs=None, top_
         # Everyone is manually paired
         return [(0, manual_pairs, [], {'note': 'All pairs are manual'})]
     
-    # Generate all possible pairings for available people
-    all_solutions = get_all_possible_pairings(available_people)
-    
-    print(f"Generated {len(all_solutions)} possible solutions")
+    # Work these out once rather than for every solution
+    last_paired = get_last_paired_weeks(data)
+    people_stats = data['people']
+    avg_left_out = get_average_left_out(people_stats)
+    target_week_num = _week_to_num(target_week)
+    
+    if len(available_people) in _MATCHINGS:
+        # Small enough to just score every precomputed pairing
+        auto_solutions = rank_all_pairings(available_people, last_paired, avg_left_out,
+                                           people_stats, target_week_num, top_n)
+        print(f"Scored all {len(_MATCHINGS[len(available_people)])} possible solutions")
+    elif nx is not None:
+        # Each pair's score is independent of the others, so the best
+        # solutions are maximum weight matchings - no need to enumerate
+        auto_solutions = find_best_matchings(available_people, last_paired, avg_left_out,
+                                             people_stats, target_week_num, top_n)
+        print(f"Solved weighted matching for {len(available_people)} people")
+    elif len(available_people) > MAX_SEARCH_GROUP_SIZE:
+        raise RuntimeError(
+            f"Pairing {len(available_people)} people needs networkx - without it "
+            f"groups are limited to {MAX_SEARCH_GROUP_SIZE} people"
+        )
+    else:
+        # Search the possible pairings, skipping any that can't make the top N
+        auto_solutions = search_best_pairings(available_people, last_paired, avg_left_out,
+                                              people_stats, target_week_num, top_n)
+        print(f"Searched possible pairings for {len(available_people)} people")
     
-    # Score each solution
+    # Solutions are already the top N, best first - just score each one
+    # with the manual pairs added to get its breakdown
     scored_solutions = []
-    for auto_pairs, left_out in all_solutions:
-        # Combine manual and auto pairs
+    for auto_pairs, left_out in auto_solutions:
         all_pairs = manual_pairs + auto_pairs
-        score, breakdown = score_solution(all_pairs, left_out, data, target_week)
+        score, breakdown = score_solution(all_pairs, left_out, last_paired, avg_left_out,
+                                          people_stats, target_week_num)
         scored_solutions.append((score, all_pairs, left_out, breakdown))
     
-    # Sort by score (descending) and return top N
-    scored_solutions.sort(key=lambda x: x[0], reverse=True)
-    return scored_solutions[:top_n]
+    return scored_solutions
+
+def rank_all_pairings(people, last_paired, avg_left_out, people_stats, target_week_num,
+                      top_n=3, weights=None):
+    """
+    Find the top N pairings of a small group by scoring every one of the
+    precomputed pairings in _MATCHINGS.
+    
+    Returns:
+        List of [pairs, left_out] solutions, best first
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    
+    if top_n < 1:
+        return []
+    
+    pair_weight = get_pair_weights(people, last_paired, target_week_num, weights)
+    left_out_scores = [
+        score_left_out(person, people_stats, avg_left_out, weights)
+        for person in people
+    ]
+    
+    # Min-heap of (score, tiebreak, pairs, left_out)
+    top_solutions = []
+    for count, (pairs, left_out) in enumerate(_MATCHINGS[len(people)]):
+        score = 0 if left_out is None else left_out_scores[left_out]
+        for pair in pairs:
+            score += pair_weight[pair]
+        
+        _push_top_n(top_solutions, top_n, (score, -count, pairs, left_out))
+    
+    return [
+        [[(people[i], people[j]) for i, j in pairs], [] if left_out is None else [people[left_out]]]
+        for _, _, pairs, left_out in sorted(top_solutions, reverse=True)
+    ]
+
+# The search's worst case grows exponentially, so without networkx only
+# groups up to this size are paired (the slowest seen took ~0.2s)
+MAX_SEARCH_GROUP_SIZE = 22
+
+def search_best_pairings(people, last_paired, avg_left_out, people_stats, target_week_num,
+                         top_n=3, weights=None):
+    """
+    Find the top N pairings of people by branch and bound.
+    
+    Pairings are built up one pair at a time, scoring as we go. Every
+    pair's score is split evenly between its two people, so the people
+    still unpaired can add at most half of each one's best score with
+    someone else still unpaired. Once the top N are found, any branch
+    whose score plus that bound can't beat the worst of them is skipped.
+    Partners are tried best first so good solutions are found early, and
+    whoever has the best remaining pair is paired next.
+    
+    Returns:
+        List of [pairs, left_out] solutions, best first
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    
+    if top_n < 1:
+        return []
+    
+    n = len(people)
+    pair_weight = get_pair_weights(people, last_paired, target_week_num, weights)
+    weight = [[0] * n for _ in range(n)]
+    for (i, j), pair_score in pair_weight.items():
+        weight[i][j] = weight[j][i] = pair_score
+    
+    # Everyone each person could pair with, best first
+    ranked_partners = [
+        sorted((j for j in range(n) if j != i), key=lambda j: -weight[i][j])
+        for i in range(n)
+    ]
+    
+    # Try each person as left out, starting with whoever is fairest
+    left_out_scores = {}
+    if n % 2 == 1:
+        left_out_scores = {
+            i: score_left_out(person, people_stats, avg_left_out, weights)
+            for i, person in enumerate(people)
+        }
+    left_out_order = sorted(left_out_scores, key=lambda i: -left_out_scores[i])
+    
+    solutions = _branch_and_bound(n, weight, ranked_partners, left_out_scores, left_out_order, top_n)
+    
+    return [
+        [[(people[i], people[j]) for i, j in pairs], [people[i] for i in left_out]]
+        for pairs, left_out in solutions
+    ]
+
+def _branch_and_bound(n, weight, ranked_partners, left_out_scores, left_out_order, top_n):
+    """
+    Branch and bound search over people 0..n-1.
+    Returns list of (index_pairs, left_out_indices) solutions, best first.
+    """
+    # Min-heap of (score, tiebreak, pairs, left_out)
+    top_solutions = []
+    counter = itertools.count()
+    
+    def assess(mask):
+        """
+        Bound what the unpaired people in mask could still add to a score,
+        and pick who to pair next: whoever has the most to gain, since
+        settling them tightens the bound fastest.
+        """
+        total = 0
+        pivot = None
+        pivot_best = None
+        people = mask
+        while people:
+            person_bit = people & -people
+            people ^= person_bit
+            person = person_bit.bit_length() - 1
+            for partner in ranked_partners[person]:
+                if mask >> partner & 1:
+                    best = weight[person][partner]
+                    total += best
+                    if pivot is None or best > pivot_best:
+                        pivot = person
+                        pivot_best = best
+                    break
+        return total / 2, pivot
+    
+    def search(mask, score, pairs, left_out, pivot):
+        if not mask:
+            _push_top_n(top_solutions, top_n, (score, -next(counter), tuple(sorted(pairs)), left_out))
+            return
+        
+        remaining = mask ^ (1 << pivot)
+        for partner in ranked_partners[pivot]:
+            partner_bit = 1 << partner
+            if not remaining & partner_bit:
+                continue
+            
+            new_mask = remaining ^ partner_bit
+            new_score = score + weight[pivot][partner]
+            upper_bound, new_pivot = assess(new_mask)
+            if len(top_solutions) == top_n and new_score + upper_bound <= top_solutions[0][0]:
+                continue
+            
+            search(new_mask, new_score, pairs + (_pkey(pivot, partner),), left_out, new_pivot)
+    
+    all_people = (1 << n) - 1
+    if left_out_order:
+        for left_out in left_out_order:
+            mask = all_people ^ (1 << left_out)
+            score = left_out_scores[left_out]
+            upper_bound, pivot = assess(mask)
+            if len(top_solutions) == top_n and score + upper_bound <= top_solutions[0][0]:
+                continue
+            search(mask, score, (), (left_out,), pivot)
+    else:
+        search(all_people, 0, (), (), assess(all_people)[1])
+    
+    return [(pairs, left_out) for _, _, pairs, left_out in sorted(top_solutions, reverse=True)]
+
+def _push_top_n(top_solutions, top_n, entry):
+    """Add entry to a min-heap that keeps only the top_n highest scoring (score first) entries"""
+    if len(top_solutions) < top_n:
+        heapq.heappush(top_solutions, entry)
+    elif entry[0] > top_solutions[0][0]:
+        heapq.heapreplace(top_solutions, entry)
+
+def find_best_matchings(people, last_paired, avg_left_out, people_stats, target_week_num,
+                        top_n=3, weights=None):
+    """
+    Find the top N pairings of people using maximum weight matching.
+    
+    Every pair of people is an edge weighted by its score_pair() score.
+    With an odd number of people, a dummy node is added whose edge to
+    each person carries the fairness score of leaving that person out,
+    so whoever gets matched with it sits out this week.
+    
+    The best matching comes from Edmonds' Blossom algorithm. The runners
+    up come from Murty's partitioning: for each edge in a solution, solve
+    again with that edge removed and the edges before it forced in.
+    
+    Returns:
+        List of [pairs, left_out] solutions, best first
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    
+    # Nodes are indices into people
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(
+        (i, j, pair_score)
+        for (i, j), pair_score in get_pair_weights(people, last_paired, target_week_num, weights).items()
+    )
+    
+    left_out_node = len(people)
+    if len(people) % 2 == 1:
+        for i, person in enumerate(people):
+            fairness_score = score_left_out(person, people_stats, avg_left_out, weights)
+            graph.add_edge(i, left_out_node, weight=fairness_score)
+    
+    # Every solution is a perfect matching with the same number of edges,
+    # so shifting all weights to be positive doesn't change which is best
+    offset = 1 - min(w for _, _, w in graph.edges(data='weight'))
+    for _, _, edge_data in graph.edges(data=True):
+        edge_data['weight'] += offset
+    
+    def solve(forced, removed):
+        """Best matching containing every forced edge and no removed edge"""
+        subgraph = graph.copy()
+        subgraph.remove_nodes_from(node for edge in forced for node in edge)
+        subgraph.remove_edges_from(removed)
+        matching = nx.max_weight_matching(subgraph, maxcardinality=True)
+        if 2 * len(matching) != subgraph.number_of_nodes():
+            return None
+        edges = list(forced) + list(matching)
+        return sum(graph.edges[edge]['weight'] for edge in edges), edges
+    
+    # Max-heap of (score, tiebreak, edges, forced, removed)
+    counter = itertools.count()
+    candidates = []
+    best = solve([], [])
+    if best is not None:
+        heapq.heappush(candidates, (-best[0], next(counter), best[1], [], []))
+    
+    solutions = []
+    while candidates and len(solutions) < top_n:
+        _, _, edges, forced, removed = heapq.heappop(candidates)
+        
+        pairs = []
+        left_out = []
+        for i, j in sorted(tuple(sorted(edge)) for edge in edges):
+            if j == left_out_node:
+                left_out.append(people[i])
+            else:
+                pairs.append((people[i], people[j]))
+        solutions.append([pairs, left_out])
+        
+        # Partition the rest of the solution space around this solution
+        free_edges = [edge for edge in edges if edge not in forced]
+        for i, edge in enumerate(free_edges):
+            child_forced = forced + free_edges[:i]
+            child_removed = removed + [edge]
+            child = solve(child_forced, child_removed)
+            if child is not None:
+                heapq.heappush(candidates, (-child[0], next(counter), child[1], child_forced, child_removed))
+    
+    return solutions
 
 # Test function
 def test_pairing_algorithm():
@@ -278,6 +590,29 @@ def test_pairing_algorithm():
         print(f"  Pairs: {pairs}")
         print(f"  Left out: {left_out}")
         print(f"  Breakdown: {breakdown}")
+    
+    # Every strategy should rank the same top scores
+    print("\n--- Checking search strategies agree ---")
+    last_paired = get_last_paired_weeks(test_data)
+    people_stats = test_data['people']
+    avg_left_out = get_average_left_out(people_stats)
+    target_week_num = _week_to_num(target_week)
+    
+    strategies = {'rank_all_pairings': rank_all_pairings, 'search_best_pairings': search_best_pairings}
+    if nx is not None:
+        strategies['find_best_matchings'] = find_best_matchings
+    
+    expected = None
+    for name, strategy in strategies.items():
+        solutions = strategy(active_people, last_paired, avg_left_out, people_stats, target_week_num, top_n=5)
+        scores = [
+            round(score_solution(pairs, left_out, last_paired, avg_left_out, people_stats, target_week_num)[0], 6)
+            for pairs, left_out in solutions
+        ]
+        print(f"{name}: {scores}")
+        if expected is None:
+            expected = scores
+        assert scores == expected, f"{name} disagrees with rank_all_pairings"
 
 if __name__ == '__main__':
     test_pairing_algorithm()
@@ -0,0 +1,77 @@
+"""
+Tests for the Coffee Roulette CLI
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import coffee
+
+JSON_BACKENDS = [None] + ([coffee.orjson] if coffee.orjson else [])
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    # coffee.json lives in the working directory
+    monkeypatch.chdir(tmp_path)
+    return CliRunner()
+
+
+@pytest.mark.parametrize('backend', JSON_BACKENDS, ids=lambda b: 'orjson' if b else 'json')
+def test_save_and_load_round_trip(runner, monkeypatch, backend):
+    monkeypatch.setattr(coffee, 'orjson', backend)
+
+    assert runner.invoke(coffee.cli, ['add-person', 'Zoë']).exit_code == 0
+    assert runner.invoke(coffee.cli, ['toggle', 'Zoë']).exit_code == 0
+
+    result = runner.invoke(coffee.cli, ['list-people'])
+    assert result.exit_code == 0
+    assert "Inactive people (1):\n  ✗ Zoë (left out: 0, participated: 0)" in result.output
+
+
+@pytest.mark.skipif(coffee.orjson is None, reason="needs orjson")
+def test_json_and_orjson_write_identical_files(runner, monkeypatch):
+    runner.invoke(coffee.cli, ['add-person', 'Zoë'])
+    with_orjson = coffee.DATA_FILE.read_bytes()
+
+    coffee.DATA_FILE.unlink()
+    monkeypatch.setattr(coffee, 'orjson', None)
+    runner.invoke(coffee.cli, ['add-person', 'Zoë'])
+
+    assert coffee.DATA_FILE.read_bytes() == with_orjson
+    assert 'Zoë' in with_orjson.decode('utf-8')
+
+
+def test_save_flattens_legacy_weeks_and_drops_pair_index(runner):
+    legacy = {
+        "people": {},
+        "pairings": {
+            "2025-30": {
+                "manual_pairs": [["Ann", "Bob"]],
+                "auto_pairs": [["Cat", "Dan"]],
+                "left_out": [],
+            },
+        },
+        "pair_index": [["Ann", "Bob", ["2025-30"]]],
+    }
+    coffee.DATA_FILE.write_text(json.dumps(legacy))
+
+    assert runner.invoke(coffee.cli, ['add-person', 'Eve']).exit_code == 0
+
+    saved = json.loads(coffee.DATA_FILE.read_text())
+    assert saved["pairings"]["2025-30"] == {
+        "pairs": [["Ann", "Bob"], ["Cat", "Dan"]],
+        "left_out": [],
+    }
+    assert "pair_index" not in saved
+
+
+def test_save_without_pairings_section(runner):
+    coffee.DATA_FILE.write_text(json.dumps({"people": {}}))
+
+    result = runner.invoke(coffee.cli, ['add-person', 'Ann'])
+
+    assert result.exit_code == 0
+    assert "Added 'Ann'" in result.output
@@ -0,0 +1,73 @@
+"""
+Tests for the Coffee Roulette pairing algorithm
+"""
+
+import random
+
+import pytest
+
+import pairings
+
+
+def make_data(rng, size, weeks):
+    """Random people and weekly pairing history"""
+    names = [f"Person {i}" for i in range(size)]
+    people = {
+        name: {'active': True, 'times_left_out': rng.randint(0, 3), 'total_weeks_participated': 5}
+        for name in names
+    }
+    history = {}
+    for week in range(weeks):
+        shuffled = names[:]
+        rng.shuffle(shuffled)
+        history[f"2025-{week + 10:02d}"] = {
+            'pairs': [shuffled[i:i + 2] for i in range(0, size - 1, 2)],
+        }
+    return names, {'people': people, 'pairings': history}
+
+
+def ranked_scores(strategy, names, data, target_week, top_n):
+    """Top scores a strategy finds, as score_solution scores them"""
+    last_paired = pairings.get_last_paired_weeks(data)
+    avg_left_out = pairings.get_average_left_out(data['people'])
+    target_week_num = pairings._week_to_num(target_week)
+    solutions = strategy(names, last_paired, avg_left_out, data['people'], target_week_num, top_n)
+    return [
+        round(pairings.score_solution(pairs, left_out, last_paired, avg_left_out,
+                                      data['people'], target_week_num)[0], 6)
+        for pairs, left_out in solutions
+    ]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_search_matches_exhaustive_ranking(seed):
+    rng = random.Random(seed)
+    names, data = make_data(rng, rng.randint(2, pairings.SMALL_GROUP_SIZE), rng.randint(0, 6))
+    top_n = rng.randint(1, 5)
+
+    expected = ranked_scores(pairings.rank_all_pairings, names, data, '2025-20', top_n)
+    assert ranked_scores(pairings.search_best_pairings, names, data, '2025-20', top_n) == expected
+    if pairings.nx is not None:
+        assert ranked_scores(pairings.find_best_matchings, names, data, '2025-20', top_n) == expected
+
+
+@pytest.mark.skipif(pairings.nx is None, reason="needs networkx")
+def test_search_prunes_large_group_with_unmet_pairs():
+    # Everyone has met except a few pairs, which used to defeat pruning
+    rng = random.Random(0)
+    names, data = make_data(rng, pairings.MAX_SEARCH_GROUP_SIZE, 40)
+    all_pairs = [[a, b] for i, a in enumerate(names) for b in names[i + 1:]]
+    unmet = all_pairs[:3]
+    for week_data in data['pairings'].values():
+        week_data['pairs'] = [pair for pair in week_data['pairs'] if sorted(pair) not in unmet]
+    data['pairings']['2024-01'] = {'pairs': all_pairs[3:]}
+
+    expected = ranked_scores(pairings.find_best_matchings, names, data, '2025-50', 3)
+    assert ranked_scores(pairings.search_best_pairings, names, data, '2025-50', 3) == expected
+
+
+def test_large_group_without_networkx_is_refused(monkeypatch):
+    monkeypatch.setattr(pairings, 'nx', None)
+    names, data = make_data(random.Random(0), pairings.MAX_SEARCH_GROUP_SIZE + 1, 2)
+    with pytest.raises(RuntimeError, match="needs networkx"):
+        pairings.find_best_pairings(names, data, '2025-20')